@@ -1,10 +1,21 @@
 import asyncio
 import logging
+from collections import defaultdict
+from itertools import islice
+import jmespath
 from webpath.core import Client
+from webpath.runtime import run
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("FinalDemo")
 
+_UNI_PROJ = jmespath.compile(
+    "[?domains[0]].{name: name, domain: domains[0], website: web_pages[0], state: state_province}"
+)
+_TECH_PROJ = jmespath.compile(
+    "[*].{name: name, country: country, domain: domains[0]}"
+)
+
 def retry_with_backoff(response):
     if response.status_code >= 500:
         wait_time = 2.0
@@ -28,18 +39,14 @@ async def demo_university_search():
         
         try:
             countries = ["United States", "United Kingdom", "Canada", "Australia"]
-            
-            for country in countries:
+
+            tasks = [uni_api.aget("search", country=country) for country in countries]
+            responses = await asyncio.gather(*tasks)
+
+            for country, response in zip(countries, responses):
                 print(f"\n Searching universities in {country}...")
-                
-                response = await uni_api.aget(
-                    "search",
-                    country=country
-                )
-                
-                universities = response.find_all(
-                    "[?domains[0]].{name: name, domain: domains[0], website: web_pages[0], state: state_province}"
-                )
+
+                universities = response.search_compiled(_UNI_PROJ, default=[])
                 
                 if country == "United States":
                     edu_unis = [u for u in universities if u.get('domain', '').endswith('.edu')]
@@ -58,28 +65,21 @@ async def demo_university_search():
                     print(f" {i}. {name}")
                     print(f" Domain: {domain} | State: {state}")
                     print(f" Website: {website}")
-                
-                await asyncio.sleep(1)
-            
+
             print(f"\n Searching for tech focused college...")
             
             tech_response = await uni_api.aget("search", name="technology")
             
-            tech_unis = tech_response.find_all(
-                "[*].{name: name, country: country, domain: domains[0]}"
-            )
+            tech_unis = tech_response.search_compiled(_TECH_PROJ, default=[])
             
-            by_country = {}
+            by_country = defaultdict(list)
             for uni in tech_unis:
-                country = uni.get('country', 'Unknown')
-                if country not in by_country:
-                    by_country[country] = []
-                by_country[country].append(uni)
-            
+                by_country[uni.get('country', 'Unknown')].append(uni)
+
             print(f"Technology universities by country:")
-            for country, unis in list(by_country.items())[:5]:
+            for country, unis in islice(by_country.items(), 5):
                 print(f" {country}: {len(unis)} universities")
-                for uni in unis[:2]: 
+                for uni in islice(unis, 2):
                     print(f" - {uni.get('name', 'Unknown')}")
                     
         except Exception as e:
@@ -90,4 +90,4 @@ async def main():
     await demo_university_search()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
@@ -1,10 +1,19 @@
 import asyncio
 import logging
+import jmespath
 from webpath.core import Client
+from webpath.runtime import run
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("RealWorldDemo")
 
+_PRODUCT_PROJ = jmespath.compile(
+    "products[*].{name: product_name, brand: brands, grade: nutrition_grades, energy: energy_100g, countries: countries_tags[0]}"
+)
+_COKE_PROJ = jmespath.compile(
+    "product.{name: product_name, brands: brands, energy: nutriments.energy_100g, sugars: nutriments.sugars_100g, ingredients: ingredients_text_en, country: countries_tags[0]}"
+)
+
 def smart_retry_logic(response):
     if response.status_code >= 500:
         wait_time = 3.0
@@ -40,7 +49,7 @@ async def demo_food_database():
                 fields="product_name,brands,nutrition_grades,energy_100g,countries_tags"
             )
             
-            products = search_response.find_all("products[*].{name: product_name, brand: brands, grade: nutrition_grades, energy: energy_100g, countries: countries_tags[0]}")
+            products = search_response.search_compiled(_PRODUCT_PROJ, default=[])
             
             print(f" Found {len(products)} chocolate products:")
             for i, product in enumerate(products, 1):
@@ -57,17 +66,15 @@ async def demo_food_database():
             coke_response = await food_api.aget("product", "5449000000996") 
             
             if coke_response.status_code == 200:
-                product_info = coke_response.extract(
-                    "product.product_name",
-                    "product.brands", 
-                    "product.nutriments.energy_100g",
-                    "product.nutriments.sugars_100g",
-                    "product.ingredients_text_en",
-                    "product.countries_tags[0]"
-                )
-                
-                name, brands, energy, sugars, ingredients, country = product_info
-                
+                product_info = coke_response.search_compiled(_COKE_PROJ, default={})
+
+                name = product_info.get('name')
+                brands = product_info.get('brands')
+                energy = product_info.get('energy')
+                sugars = product_info.get('sugars')
+                ingredients = product_info.get('ingredients')
+                country = product_info.get('country')
+
                 print(f"* Product: {name}")
                 print(f"* Brands: {brands}")
                 print(f"* Energy: {energy} kcal/100g")
@@ -90,7 +97,7 @@ async def demo_food_database():
             logger.error(f"Food API error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(demo_food_database())
+    run(demo_food_database())
     
     try:
         with open('food_tracker.log', 'r') as f:
@@ -1,6 +1,8 @@
 import asyncio
 import httpx
+from itertools import islice
 from webpath.core import Client, WebPath
+from webpath.runtime import run
 from pathlib import Path
 
 def simple_backoff(response):
@@ -20,7 +22,10 @@ async def inspect_and_archive_repo(owner, repo):
         archive_path = Path(f"./{repo}-main.zip")
         try:
             print("Fetching repo details...")
-            repo_data = await github_api.aget("repos", owner, repo)
+            repo_data, contributors_resp = await asyncio.gather(
+                github_api.aget("repos", owner, repo),
+                github_api.aget("repos", owner, repo, "contributors"),
+            )
 
             stargazers_count = repo_data.find("stargazers_count")
             default_branch = repo_data.find("default_branch")
@@ -28,18 +33,18 @@ async def inspect_and_archive_repo(owner, repo):
 
             zip_url = f"https://api.github.com/repos/{owner}/{repo}/zipball/{default_branch}"
             print(f"Archive URL: {zip_url}")
-            
+
             WebPath(zip_url).download(archive_path)
-            
+
             file_size = archive_path.stat().st_size
             print(f"Repository archive saved to '{archive_path}' ({file_size:,} bytes)")
 
-            all_contributors = (await github_api.aget("repos", owner, repo, "contributors")).paginate_all()
+            all_contributors = await contributors_resp.apaginate_all()
             
             print(f"Found {len(all_contributors)} contributors.")
             
             if all_contributors:
-                top_5 = [c['login'] for c in all_contributors[:5]]
+                top_5 = [c['login'] for c in islice(all_contributors, 5)]
                 print(f"Top 5 contributors: {', '.join(top_5)}")
             else:
                 print("No contributors found.")
@@ -54,4 +59,4 @@ async def inspect_and_archive_repo(owner, repo):
                 archive_path.unlink()
 
 if __name__ == "__main__":
-    asyncio.run(inspect_and_archive_repo(owner="duriantaco", repo="skylos"))
\ No newline at end of file
+    run(inspect_and_archive_repo(owner="duriantaco", repo="skylos"))
\ No newline at end of file
@@ -1,11 +1,16 @@
 import asyncio
 import httpx
+import jmespath
 from webpath.core import Client
+from webpath.runtime import run
 
-async def explore_pokemon(pokemon_name):
+POKE_API_BASE = "https://pokeapi.co/api/v2/"
+
+_TYPE_NAMES = jmespath.compile("types[*].type.name")
+_EN_EFFECTS = jmespath.compile("effect_entries[?language.name=='en'].effect")
+
+async def explore_pokemon(poke_api, pokemon_name):
     print(f"\n--- Exploring Pokémon: {pokemon_name.capitalize()} ---")
-    
-    poke_api = Client("https://pokeapi.co/api/v2/")
 
     try:
         pokemon = await poke_api.aget("pokemon", pokemon_name)
@@ -13,7 +18,7 @@ async def explore_pokemon(pokemon_name):
         name, pokemon_id, height = pokemon.extract("name", "id", "height")
         print(f"Name: {name.capitalize()} (ID: {pokemon_id}, Height: {height})")
 
-        type_names = pokemon.find_all("types[*].type.name")
+        type_names = pokemon.search_compiled(_TYPE_NAMES, default=[])
         print(f"Types: {', '.join(t.capitalize() for t in type_names)}")
 
         first_ability_info = pokemon.find("abilities[0].ability")
@@ -29,9 +34,10 @@ async def explore_pokemon(pokemon_name):
             return
 
         print(f"Fetching details: '{ability_name}'...")
-        ability_details = await Client(ability_url).aget()
-        
-        description_list = ability_details.find("effect_entries[?language.name=='en'].effect")
+        ability_path = ability_url.replace(POKE_API_BASE, "").strip("/")
+        ability_details = await poke_api.aget(*ability_path.split("/"))
+
+        description_list = ability_details.search_compiled(_EN_EFFECTS)
 
         if description_list:
             description = description_list[0].strip()
@@ -43,11 +49,35 @@ async def explore_pokemon(pokemon_name):
         print(f"Could not find Pokémon '{pokemon_name}'. Status: {e.response.status_code}")
     except Exception as e:
         print(f"error occurred: {e}")
-    finally:
-        await poke_api.aclose()
 
 
-if __name__ == "__main__":
+async def worker(poke_api, queue):
+    while True:
+        pokemon_name = await queue.get()
+        try:
+            await explore_pokemon(poke_api, pokemon_name)
+        finally:
+            queue.task_done()
+
+
+async def main(num_workers=4):
     pokemon_to_find = ["pikachu", "charmander", "gengar", "snorlax"]
-    for pokemon in pokemon_to_find:
-        asyncio.run(explore_pokemon(pokemon))
\ No newline at end of file
+
+    async with Client(POKE_API_BASE) as poke_api:
+        queue = asyncio.Queue()
+        for pokemon_name in pokemon_to_find:
+            queue.put_nowait(pokemon_name)
+
+        workers = [
+            asyncio.create_task(worker(poke_api, queue))
+            for _ in range(num_workers)
+        ]
+
+        await queue.join()
+
+        for task in workers:
+            task.cancel()
+
+
+if __name__ == "__main__":
+    run(main())
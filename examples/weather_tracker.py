@@ -1,15 +1,21 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import httpx
 import asyncio
 from webpath.core import Client
+from webpath.runtime import run
 from pathlib import Path
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename='weather_reporter.log',
-    filemode='w'
-)
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler('weather_reporter.log', mode='w')
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+listener = QueueListener(log_queue, file_handler)
+listener.start()
+atexit.register(listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
 logger = logging.getLogger("WeatherApp")
 print("Logging configured. API requests will save at 'weather_reporter.log'.")
 
@@ -55,9 +61,14 @@ async def get_weather_report(latitude, longitude, city):
             return
         
         try:
-            temperature = weather_response.find("current_weather.temperature", default="N/A")
-            wind_speed = weather_response.find("current_weather.windspeed", default="N/A")
-            
+            temperature, wind_speed = (
+                value if value is not None else "N/A"
+                for value in weather_response.extract(
+                    "current_weather.temperature",
+                    "current_weather.windspeed"
+                )
+            )
+
             print("Current Weather:")
             print(f" - Temperature: {temperature}°C")
             print(f" - Wind Speed: {wind_speed} km/h")
@@ -102,7 +113,7 @@ async def get_weather_report(latitude, longitude, city):
 if __name__ == "__main__":
     sg_latitude, sg_longitude = 1.3521, 103.8198
     
-    asyncio.run(get_weather_report(sg_latitude, sg_longitude, "Singapore"))
+    run(get_weather_report(sg_latitude, sg_longitude, "Singapore"))
 
     test_api = Client("https://httpbin.org", retries=fixed_delay_backoff, enable_logging=True)
     try:
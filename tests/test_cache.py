@@ -1,8 +1,17 @@
 import time
 import tempfile
+import pytest
 from pathlib import Path
 from unittest.mock import Mock
-from webpath.cache import CacheConfig
+from webpath.cache import CacheConfig, _MemoryTTLCache, diskcache
+
+def make_response(content=b'test', headers=None):
+    response = Mock()
+    response.status_code = 200
+    response.headers = headers or {}
+    response.content = content
+    response.url = "https://example.com"
+    return response
 
 def test_cache_creation():
     cache = CacheConfig()
@@ -78,4 +87,68 @@ def test_sensitive_headers_filtered():
         cached = cache.get("get", "https://example.com")
         
         assert "Content-Type" in cached["headers"]
-        assert "Authorization" not in cached["headers"]
\ No newline at end of file
+        assert "Authorization" not in cached["headers"]
+
+def test_memory_cache_hit():
+    cache = _MemoryTTLCache()
+    cache.put("key", {"value": 1}, None)
+    assert cache.get("key") == {"value": 1}
+    assert cache.get("missing") is None
+
+def test_memory_cache_expiry():
+    cache = _MemoryTTLCache()
+    cache.put("key", "value", 0.05)
+    assert cache.get("key") == "value"
+
+    time.sleep(0.06)
+    assert cache.get("key") is None
+
+def test_memory_cache_eviction():
+    cache = _MemoryTTLCache(maxsize=2)
+    cache.put("a", 1, None)
+    cache.put("b", 2, None)
+    cache.get("a")
+    cache.put("c", 3, None)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+def test_effective_ttl_adapts_to_content_stability():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = CacheConfig(ttl=300, cache_dir=Path(tmpdir))
+        url = "https://example.com"
+
+        cache.set("get", url, make_response(b'same'))
+        cache.set("get", url, make_response(b'same'))
+        assert cache.get("get", url)["effective_ttl"] == 300
+
+        cache.set("get", url, make_response(b'changed'))
+        assert cache.get("get", url)["effective_ttl"] == 150
+
+        cache.set("get", url, make_response(b'changed again'))
+        assert cache.get("get", url)["effective_ttl"] == 75
+
+def test_clear_json_file_backend():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = CacheConfig(cache_dir=Path(tmpdir))
+        cache.store = None
+
+        cache.set("get", "https://example.com", make_response())
+        assert cache.get("get", "https://example.com") is not None
+
+        cache.clear()
+        assert cache.get("get", "https://example.com") is None
+        assert list(cache.cache_dir.glob("*.json")) == []
+
+@pytest.mark.skipif(diskcache is None, reason="diskcache not installed")
+def test_clear_diskcache_backend():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = CacheConfig(cache_dir=Path(tmpdir))
+        assert cache.store is not None
+
+        cache.set("get", "https://example.com", make_response())
+        assert cache.get("get", "https://example.com") is not None
+
+        cache.clear()
+        assert cache.get("get", "https://example.com") is None
\ No newline at end of file
@@ -1,7 +1,7 @@
 import pytest
 import httpx
 from unittest.mock import Mock, patch
-from webpath.core import WebPath, Client, _idna
+from webpath.core import WebPath, Client, _idna, _TRANSPORT_CACHE, download_file, adownload_file
 
 class TestIdnaFunction:
     def test_idna_ascii(self):
@@ -178,7 +178,7 @@ class TestWebPathOtherMethods:
         path = WebPath("https://api.example.com/file.zip")
         path.download("/tmp/file.zip")
         
-        mock_download.assert_called_once_with(path, "/tmp/file.zip", backoff=0.3)
+        mock_download.assert_called_once_with(path, "/tmp/file.zip")
 
     @patch('webpath.core.download_file')
     def test_download_with_retries_set(self, mock_download):
@@ -188,8 +188,8 @@ class TestWebPathOtherMethods:
         path.download("/tmp/file.zip", chunk_size=1024)
         
         mock_download.assert_called_once_with(
-            path, "/tmp/file.zip", 
-            retries=3, backoff=0.3, chunk_size=1024
+            path, "/tmp/file.zip",
+            retries=3, chunk_size=1024
         )
 
     def test_memo_caching(self):
@@ -211,6 +211,12 @@ class TestWebPathOtherMethods:
         assert parts.fragment == "frag"
 
 class TestClient:
+    def setup_method(self):
+        _TRANSPORT_CACHE.clear()
+
+    def teardown_method(self):
+        _TRANSPORT_CACHE.clear()
+
     @patch('httpx.Client')
     @patch('httpx.AsyncClient') 
     @patch('httpx.HTTPTransport')
@@ -270,6 +276,35 @@ class TestClient:
         with patch.object(client, 'aclose'):
             await client.__aexit__(None, None, None)
 
+    @patch('httpx.Client')
+    @patch('httpx.AsyncClient')
+    @patch('httpx.HTTPTransport')
+    @patch('httpx.AsyncHTTPTransport')
+    def test_aget_deduplicates_concurrent_requests(self, *mocks):
+        import asyncio
+
+        calls = []
+
+        async def fake_request(verb, url, *args, **kwargs):
+            calls.append(str(url))
+            await asyncio.sleep(0)
+            return Mock()
+
+        client = Client("https://api.example.com")
+
+        with patch('webpath.core._async_http_request', new=fake_request):
+            async def run():
+                concurrent = await asyncio.gather(*(client.aget("users") for _ in range(5)))
+                follow_up = await client.aget("users")
+                return concurrent, follow_up
+
+            concurrent, follow_up = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert all(response is concurrent[0] for response in concurrent)
+        assert follow_up is not concurrent[0]
+        assert client._inflight == {}
+
 
 class TestBasicWebPathFunctionality:
     def test_webpath_can_be_created(self):
@@ -300,5 +335,64 @@ class TestBasicWebPathFunctionality:
         assert callable(post_method)
 
 
+class TestDownloadFile:
+    @pytest.fixture
+    def file_server(self):
+        import http.server
+        import threading
+
+        data = b"webpath" * 4096
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/file.bin", data
+        server.shutdown()
+
+    def test_download_file_writes_content(self, file_server, tmp_path):
+        url, data = file_server
+        dest = download_file(url, tmp_path / "out.bin", progress=False)
+        assert dest.read_bytes() == data
+
+    def test_download_file_checksum_match(self, file_server, tmp_path):
+        import hashlib
+        url, data = file_server
+        digest = hashlib.sha256(data).hexdigest()
+        dest = download_file(url, tmp_path / "out.bin", checksum=digest, progress=False)
+        assert dest.read_bytes() == data
+
+    def test_download_file_checksum_mismatch(self, file_server, tmp_path):
+        url, _ = file_server
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            download_file(url, tmp_path / "out.bin", checksum="0" * 64, progress=False)
+        assert not (tmp_path / "out.bin").exists()
+
+    def test_download_file_with_retries(self, file_server, tmp_path):
+        url, data = file_server
+        dest = download_file(url, tmp_path / "out.bin", retries=2, progress=False)
+        assert dest.read_bytes() == data
+
+    def test_adownload_file_writes_content(self, file_server, tmp_path):
+        import asyncio
+        url, data = file_server
+        dest = asyncio.run(adownload_file(url, tmp_path / "out.bin", progress=False))
+        assert dest.read_bytes() == data
+
+    def test_adownload_file_with_retries(self, file_server, tmp_path):
+        import asyncio
+        url, data = file_server
+        dest = asyncio.run(adownload_file(url, tmp_path / "out.bin", retries=2, progress=False))
+        assert dest.read_bytes() == data
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -214,23 +214,29 @@ class TestHttpRequests:
         url._last_request_time = 0.0
         return url
 
-    @patch('webpath._http.urlsplit') 
+    @patch('webpath._http.urlsplit')
     @patch('httpx.Client')
     def test_sync_http_request_basic(self, mock_client_class, mock_urlsplit, mock_url):
+        from webpath._http import _default_sync_client
+        _default_sync_client.cache_clear()
+
         mock_split = Mock()
         mock_split.scheme = "https"
         mock_urlsplit.return_value = mock_split
-        
+
         mock_client = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True}
-        
+
         mock_client.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        
-        result = _sync_http_request("get", mock_url)
-        
+        mock_client_class.return_value = mock_client
+
+        try:
+            result = _sync_http_request("get", mock_url)
+        finally:
+            _default_sync_client.cache_clear()
+
         assert isinstance(result, WebResponse)
         mock_client.get.assert_called_once_with("https://api.example.com/test")
 
@@ -265,19 +271,103 @@ class TestHttpRequests:
         mock_split.scheme = "https"
         mock_urlsplit.return_value = mock_split
         
+        from webpath._http import _default_sync_client
+        _default_sync_client.cache_clear()
+
         mock_client = Mock()
         mock_response = Mock()
         mock_response.status_code = 404
         mock_response.request = Mock()
-        
+
         mock_client.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        
+        mock_client_class.return_value = mock_client
+
         with patch('webpath._http._get_helpful_error_message') as mock_error_msg:
             mock_error_msg.return_value = "Not found"
-            
+
+            try:
+                with pytest.raises(httpx.HTTPStatusError):
+                    _sync_http_request("get", mock_url)
+            finally:
+                _default_sync_client.cache_clear()
+
+    @patch('time.sleep')
+    def test_sync_http_request_retry_then_success(self, mock_sleep, mock_url):
+        error_response = Mock()
+        error_response.status_code = 503
+        ok_response = Mock()
+        ok_response.status_code = 200
+
+        provided_client = Mock()
+        provided_client.get.side_effect = [error_response, error_response, ok_response]
+
+        backoff_calls = []
+        def backoff(resp):
+            backoff_calls.append(resp.status_code)
+            return 0.1
+
+        result = _sync_http_request("get", mock_url, client=provided_client, retries=backoff)
+
+        assert isinstance(result, WebResponse)
+        assert provided_client.get.call_count == 3
+        assert backoff_calls == [503, 503]
+        assert mock_sleep.call_count == 2
+
+    @patch('time.sleep')
+    def test_sync_http_request_retry_exhaustion(self, mock_sleep, mock_url):
+        error_response = Mock()
+        error_response.status_code = 503
+        error_response.request = Mock()
+
+        provided_client = Mock()
+        provided_client.get.return_value = error_response
+
+        with patch('webpath._http._get_helpful_error_message', return_value="Unavailable"):
             with pytest.raises(httpx.HTTPStatusError):
-                _sync_http_request("get", mock_url)
+                _sync_http_request("get", mock_url, client=provided_client, retries=lambda resp: 0.1)
+
+        assert provided_client.get.call_count == 4
+        assert mock_sleep.call_count == 3
+
+    @patch('time.sleep')
+    def test_sync_http_request_retry_backoff_error(self, mock_sleep, mock_url):
+        error_response = Mock()
+        error_response.status_code = 500
+        error_response.request = Mock()
+
+        provided_client = Mock()
+        provided_client.get.return_value = error_response
+
+        def bad_backoff(resp):
+            raise RuntimeError("broken policy")
+
+        with patch('webpath._http._get_helpful_error_message', return_value="Server error"):
+            with pytest.raises(httpx.HTTPStatusError):
+                _sync_http_request("get", mock_url, client=provided_client, retries=bad_backoff)
+
+        assert provided_client.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_sync_http_request_streaming_skips_retry(self, mock_sleep, mock_url):
+        error_response = Mock()
+        error_response.status_code = 503
+        error_response.request = Mock()
+
+        provided_client = Mock()
+        stream_cm = MagicMock()
+        stream_cm.__enter__.return_value = error_response
+        provided_client.stream.return_value = stream_cm
+
+        backoff = Mock(return_value=0.1)
+
+        with patch('webpath._http._get_helpful_error_message', return_value="Unavailable"):
+            with pytest.raises(httpx.HTTPStatusError):
+                _sync_http_request("get", mock_url, client=provided_client, retries=backoff, stream=True)
+
+        assert provided_client.stream.call_count == 1
+        backoff.assert_not_called()
+        mock_sleep.assert_not_called()
 
     @pytest.mark.asyncio
     @patch('webpath._http.urlsplit')
@@ -287,35 +377,50 @@ class TestHttpRequests:
         mock_split.scheme = "https"
         mock_urlsplit.return_value = mock_split
         
+        from webpath._http import _async_clients
+        _async_clients.clear()
+
         mock_client = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        
+
         async def async_get(*args, **kwargs):
             return mock_response
-            
+
         mock_client.get = async_get
-        
-        async def mock_aenter(self):
-            return mock_client
-        async def mock_aexit(self, exc_type, exc_val, exc_tb):
-            pass
-            
-        mock_client_instance = Mock()
-        mock_client_instance.__aenter__ = mock_aenter
-        mock_client_instance.__aexit__ = mock_aexit
-        mock_client_class.return_value = mock_client_instance
-        
-        result = await _async_http_request("get", mock_url)
-        
+        mock_client_class.return_value = mock_client
+
+        try:
+            result = await _async_http_request("get", mock_url)
+        finally:
+            _async_clients.clear()
+
         assert isinstance(result, WebResponse)
 
+    def test_default_async_client_per_loop(self):
+        import asyncio
+        from webpath._http import _default_async_client, _async_clients
+
+        _async_clients.clear()
+
+        async def grab():
+            return _default_async_client(), _default_async_client()
+
+        try:
+            first, again = asyncio.run(grab())
+            second, _ = asyncio.run(grab())
+        finally:
+            _async_clients.clear()
+
+        assert first is again
+        assert second is not first
+
     def test_handle_rate_limit_no_limit(self, mock_url):
         mock_url._rate_limit = None
         
         _handle_rate_limit(mock_url)
 
-    @patch('time.time')
+    @patch('time.monotonic')
     @patch('time.sleep')
     def test_handle_rate_limit_with_limit(self, mock_sleep, mock_time, mock_url):
         mock_url._rate_limit = 2.0  
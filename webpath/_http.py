@@ -1,42 +1,130 @@
 from __future__ import annotations
+import functools
+import re
 import time
+from collections import deque
+from itertools import chain
 import logging
-from urllib.parse import urlsplit
+from urllib.parse import urlsplit, parse_qsl
 import httpx
 import json
 import jmespath
-from rich.console import Console
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
 import asyncio
+import weakref
+
+def __getattr__(name):
+    if name == 'Console':
+        from rich.console import Console
+        return Console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _console():
+    cls = globals().get('Console')
+    if cls is None:
+        from rich.console import Console as cls
+    return cls()
 
 _HTTP_SCHEMES = ("http", "https")
+_HTTP_PREFIXES = ("http://", "https://")
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+@functools.lru_cache(maxsize=512)
+def _compile(expression):
+    return jmespath.compile(expression)
+
+_SIMPLE_PATH = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*\Z')
+_JMESPATH_LITERALS = ('true', 'false', 'null')
+
+@functools.lru_cache(maxsize=512)
+def _split_path(expression):
+    return expression.split('.')
+
+def _search_one(expression, data):
+    if _SIMPLE_PATH.match(expression) and expression not in _JMESPATH_LITERALS:
+        for key in _split_path(expression):
+            if isinstance(data, dict):
+                data = data.get(key)
+            else:
+                return None
+        return data
+    return _compile(expression).search(data)
+
+for _expr in (
+    "next || next_url || pagination.next",
+    "prev || prev_url || pagination.prev",
+    "total || count || pagination.total",
+    "page || pagination.page",
+    "per_page || limit || pagination.per_page || pagination.limit",
+    "data || results || items || records || content",
+):
+    for _part in _expr.split(' || '):
+        _compile(_part)
+del _expr, _part
 
 class CachedResponse:
+    __slots__ = ('status_code', 'headers', 'url', '_content', '_parsed')
+
     def __init__(self, cached_data):
         self.status_code = cached_data['status_code']
-        self.headers = cached_data['headers']
-        self.content = cached_data['content'].encode('utf-8')
-        self.text = cached_data['content']
+        self.headers = httpx.Headers(cached_data['headers'])
         self.url = cached_data['url']
-    
+        self._content = cached_data.get('content')
+        self._parsed = cached_data.get('parsed')
+
+    @property
+    def text(self):
+        if self._content is None:
+            self._content = json.dumps(self._parsed)
+        return self._content
+
+    @property
+    def content(self):
+        return self.text.encode('utf-8')
+
     def json(self):
-        return json.loads(self.content)
-    
+        if self._parsed is not None:
+            return self._parsed
+        return _loads(self.content)
+
     def raise_for_status(self):
         if 400 <= self.status_code < 600:
             raise httpx.HTTPStatusError(f"{self.status_code} Client Error", request=None, response=self)
         
 class WebResponse:
+    __slots__ = ('_response', '_parent', '_json_data', '_raw_bytes')
+
     def __init__(self, response, parent_path):
         self._response = response
         self._parent = parent_path
         self._json_data = None
-    
+        self._raw_bytes = None
+
     def __getattr__(self, name):
         return getattr(self._response, name)
+
+    @property
+    def content(self):
+        if self._raw_bytes is None:
+            self._raw_bytes = self._response.content
+        return self._raw_bytes
     
     def iter_content(self, chunk_size=8192):
         if hasattr(self._response, 'iter_bytes'):
@@ -52,22 +140,23 @@ class WebResponse:
         data = self.json_data
         
         if ' || ' in expression:
-            parts = expression.split(' || ')
-            expressions = []
-            for part in parts:
-                expressions.append(part.strip())
-
-            for expr in expressions:
-                result = jmespath.search(expr, data)
+            for part in expression.split(' || '):
+                result = _search_one(part.strip(), data)
                 if result is not None:
                     return result
             return default
         else:
-            result = jmespath.search(expression, data)
+            result = _search_one(expression, data)
             if result is not None:
                 return result
             return default
 
+    def search_compiled(self, compiled, default=None):
+        result = compiled.search(self.json_data)
+        if result is not None:
+            return result
+        return default
+
     def find_all(self, expression):
         result = self.find(expression, default=[])
         if not result:
@@ -94,24 +183,109 @@ class WebResponse:
         
         return tuple(results)
 
+    def search(self, search_key, case_sensitive=False):
+        if not case_sensitive:
+            search_key = search_key.lower()
+
+        results = []
+        append = results.append
+        stack = deque([self.json_data])
+        push = stack.append
+        extend = stack.extend
+        pop = stack.pop
+
+        while stack:
+            current = pop()
+            if type(current) is dict:
+                for key, value in current.items():
+                    matched = key if case_sensitive else key.lower()
+                    if search_key in matched:
+                        append(value)
+                    if type(value) is dict or type(value) is list:
+                        push(value)
+            elif type(current) is list:
+                extend(x for x in current if type(x) is dict or type(x) is list)
+
+        return results
+
+    def _search_multi(self, keys_lower):
+        buckets = {key: [] for key in keys_lower}
+        stack = deque([self.json_data])
+
+        while stack:
+            current = stack.pop()
+            if type(current) is dict:
+                for key, value in current.items():
+                    key_lower = key.lower()
+                    for target in keys_lower:
+                        if target in key_lower:
+                            buckets[target].append(value)
+                    if type(value) is dict or type(value) is list:
+                        stack.append(value)
+            elif type(current) is list:
+                stack.extend(x for x in current if type(x) is dict or type(x) is list)
+
+        return buckets
+
+    def get_errors(self):
+        buckets = self._search_multi(('error', 'message', 'detail'))
+        for key in ('error', 'message', 'detail'):
+            if buckets[key]:
+                return buckets[key][0]
+        return None
+
+    def get_ids(self):
+        ids = self._search_multi(('id',))['id']
+        if ids:
+            return ids[0]
+        return None
+
     def has_path(self, expression):
         sentinel = object()
         result = self.find(expression, default=sentinel)
         return result is not sentinel
 
     def get_pagination_info(self):
-        return {
-            'next': self.find("next || next_url || pagination.next"),
-            'prev': self.find("prev || prev_url || pagination.prev"), 
-            'total': self.find("total || count || pagination.total"),
-            'page': self.find("page || pagination.page"),
-            'per_page': self.find("per_page || limit || pagination.per_page || pagination.limit")
-        }
+        info = {'next': None, 'prev': None, 'total': None, 'page': None, 'per_page': None}
+
+        data = self.json_data
+        if not isinstance(data, dict):
+            return info
+
+        for src in (data, data.get('pagination') or {}, data.get('links') or {}):
+            if not isinstance(src, dict):
+                continue
+            if info['next'] is None:
+                info['next'] = src.get('next') if src.get('next') is not None else src.get('next_url')
+            if info['prev'] is None:
+                info['prev'] = src.get('prev') if src.get('prev') is not None else src.get('prev_url')
+            if info['total'] is None:
+                info['total'] = src.get('total') if src.get('total') is not None else src.get('count')
+            if info['page'] is None:
+                info['page'] = src.get('page')
+            if info['per_page'] is None:
+                info['per_page'] = src.get('per_page') if src.get('per_page') is not None else src.get('limit')
+
+        return info
     
     @property
     def json_data(self):
         if self._json_data is None:
-            self._json_data = self._response.json()
+            if isinstance(self._response, CachedResponse) and self._response._parsed is not None:
+                self._json_data = self._response._parsed
+            elif isinstance(self._response, httpx.Response):
+                parsed = getattr(self._response, '_webpath_parsed', None)
+                if parsed is not None:
+                    self._json_data = parsed
+                elif orjson is not None:
+                    try:
+                        self._json_data = orjson.loads(self.content)
+                    except Exception:
+                        self._json_data = self._response.json()
+                else:
+                    self._json_data = self._response.json()
+            else:
+                self._json_data = self._response.json()
         return self._json_data
 
     def json(self):
@@ -122,14 +296,14 @@ class WebResponse:
         
         if isinstance(data, dict):
             value = data[key]
-            if isinstance(value, str) and value.startswith(('http://', 'https://')):
+            if isinstance(value, str) and len(value) >= 7 and value[0] == 'h' and value.startswith(_HTTP_PREFIXES):
                 from webpath.core import WebPath
                 return WebPath(value).get()
             return value
         elif isinstance(data, list):
             idx = int(key)
             value = data[idx]
-            if isinstance(value, str) and value.startswith(('http://', 'https://')):
+            if isinstance(value, str) and len(value) >= 7 and value[0] == 'h' and value.startswith(_HTTP_PREFIXES):
                 from webpath.core import WebPath
                 return WebPath(value).get()
             return value
@@ -207,7 +381,7 @@ class WebResponse:
 
             if 'json' in content_type:
                 try:
-                    body_preview = json.dumps(self.json_data, indent=2)
+                    body_preview = _dumps(self.json_data)
                     body_preview = truncate_text(body_preview, 1000)
                 except Exception:
                     body_preview = truncate_text(self.text)
@@ -218,8 +392,10 @@ class WebResponse:
             logger.info(f"Headers:\n{headers_str}")
             logger.info(f"Body Preview:\n{body_preview}")
         else:
-            console = Console()
-            
+            from rich.panel import Panel
+
+            console = _console()
+
             status_info = f"[{status_color}]{status_text}[/{status_color}] * {time_text} * {size_text}"
             console.print(Panel(status_info, title="Response", border_style="blue"))
             
@@ -227,11 +403,14 @@ class WebResponse:
             self._print_headers(console)
 
     def _print_response_body(self, console):
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
         content_type = self.headers.get('content-type', '').lower()
         
         if 'json' in content_type:
             try:
-                json_text = json.dumps(self.json_data, indent=2)
+                json_text = _dumps(self.json_data)
                 syntax = Syntax(json_text, "json", theme="monokai", line_numbers=False)
                 console.print(Panel(syntax, title="Response Body", border_style="green"))
             except:
@@ -249,6 +428,10 @@ class WebResponse:
                                 title="Response Body", border_style="yellow"))
 
     def _print_headers(self, console):
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold blue", box=box.SIMPLE)
         table.add_column("Header", style="cyan", no_wrap=True)
         table.add_column("Value", style="white")
@@ -269,13 +452,44 @@ class WebResponse:
             if header in self.headers:
                 curl_cmd += f" \\\n  -H '{header}: {self.headers[header]}'"
         
-        console = Console()
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
+        console = _console()
         syntax = Syntax(curl_cmd, "bash", theme="monokai")
         console.print(Panel(syntax, title="cURL Command", border_style="green"))
         
         return curl_cmd
 
+    def _find_next_url(self, page):
+        data = page.json_data
+        if not isinstance(data, dict):
+            return None
+
+        for cand in (data.get('next'), data.get('next_url'), data.get('nextUrl'), data.get('next_page')):
+            if isinstance(cand, str) and cand.startswith(_HTTP_PREFIXES):
+                return cand
+
+        for sub_key in ('links', 'pagination'):
+            sub = data.get(sub_key)
+            if isinstance(sub, dict):
+                cand = sub.get('next')
+                if isinstance(cand, str) and cand.startswith(_HTTP_PREFIXES):
+                    return cand
+
+        links = data.get('_links')
+        if isinstance(links, dict):
+            nxt = links.get('next')
+            if isinstance(nxt, dict):
+                href = nxt.get('href')
+                if isinstance(href, str) and href.startswith(_HTTP_PREFIXES):
+                    return href
+
+        return None
+
     def paginate(self, max_pages=100, next_key=None):
+        from webpath.core import WebPath
+
         current_page = self
         page_count = 0
         
@@ -286,53 +500,159 @@ class WebResponse:
             if next_key:
                 next_url = current_page.find(next_key)
             else:
-                next_url = current_page.find("next || next_url || pagination.next")
-                
+                next_url = self._find_next_url(current_page)
+
             if not next_url:
                 break
-            
-            from webpath.core import WebPath
+
             current_page = WebPath(next_url).get()
 
     def paginate_all(self, max_pages=100, next_key=None, data_key=None):
-        all_results = []
-        for page in self.paginate(max_pages=max_pages, next_key=next_key):
-            page_data = page.json_data
-            
-            if data_key:
-                items = page.find(data_key)
-                if isinstance(items, list):
-                    all_results.extend(items)
-                elif items is not None:
-                    all_results.append(items)
+        chunks = [
+            self._page_items(page, data_key)
+            for page in self.paginate(max_pages=max_pages, next_key=next_key)
+        ]
+        return list(chain.from_iterable(chunks))
+
+    def _page_items(self, page, data_key):
+        page_data = page.json_data
+
+        if data_key:
+            items = page.find(data_key)
+            if isinstance(items, list):
+                return items
+            if items is not None:
+                return [items]
+            return []
+
+        if isinstance(page_data, list):
+            return page_data
+        if isinstance(page_data, dict):
+            items = page.find("data || results || items || records || content")
+            if isinstance(items, list):
+                return items
+            return [page_data]
+        return []
+
+    async def apaginate_all(self, max_pages=100, next_key=None, data_key=None):
+        from webpath.core import WebPath
+
+        pages = [self]
+
+        last_page = 1
+        if not next_key:
+            links = getattr(self._response, 'links', None) or {}
+            last_url = links.get('last', {}).get('url')
+
+            if last_url:
+                query = dict(parse_qsl(urlsplit(last_url).query))
+                try:
+                    last_page = int(query.get('page', 1))
+                except (TypeError, ValueError):
+                    last_page = 1
             else:
-                if isinstance(page_data, list):
-                    all_results.extend(page_data)
-                elif isinstance(page_data, dict):
-                    items = page.find("data || results || items || records || content")
-                    if isinstance(items, list):
-                        all_results.extend(items)
-                    else:
-                        all_results.append(page_data)
-        
-        return all_results
+                info = self.get_pagination_info()
+                total, per_page = info['total'], info['per_page']
+                if isinstance(total, int) and isinstance(per_page, int) and per_page > 0:
+                    last_page = -(-total // per_page)
+
+        if last_page > 1:
+            base = WebPath(str(self.url))
+            remaining = [
+                base.with_query(page=p).aget()
+                for p in range(2, min(last_page, max_pages) + 1)
+            ]
+            fetched = await asyncio.gather(*remaining, return_exceptions=True)
+            for page in fetched:
+                if isinstance(page, BaseException):
+                    raise page
+                pages.append(page)
+        else:
+            current_page = self
+            page_count = 1
+
+            while page_count < max_pages:
+                if next_key:
+                    next_url = current_page.find(next_key)
+                else:
+                    next_url = self._find_next_url(current_page)
+
+                if not next_url:
+                    break
+
+                current_page = await WebPath(next_url).aget()
+                pages.append(current_page)
+                page_count += 1
+
+        chunks = [self._page_items(page, data_key) for page in pages]
+        return list(chain.from_iterable(chunks))
 
     def paginate_items(self, item_key='data', max_pages=100):
-        all_items = []
+        chunks = []
         for page in self.paginate(max_pages=max_pages):
             items = page.find(item_key)
             if isinstance(items, list):
-                all_items.extend(items)
+                chunks.append(items)
             elif items is not None:
-                all_items.append(items)
-        return all_items
+                chunks.append([items])
+        return list(chain.from_iterable(chunks))
+
+_MAX_STATUS_RETRIES = 3
+
+@functools.lru_cache(maxsize=1024)
+def _urlsplit(url):
+    return urlsplit(url)
+
+@functools.lru_cache(maxsize=1)
+def _default_sync_client():
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+_async_clients = weakref.WeakKeyDictionary()
+
+def _default_async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100)
+        )
+        _async_clients[loop] = client
+    return client
+
+@functools.lru_cache(maxsize=16)
+def _retry_sync_client(retries):
+    return httpx.Client(
+        transport=httpx.HTTPTransport(retries=retries),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+def _status_backoff(retries):
+    backoff_callable = getattr(retries, 'backoff_callable', None)
+    if backoff_callable is not None:
+        return backoff_callable
+    if callable(retries):
+        return retries
+    return None
+
+def _retry_wait(backoff_callable, resp, attempts):
+    if backoff_callable is None or attempts >= _MAX_STATUS_RETRIES:
+        return None
+    try:
+        return backoff_callable(resp)
+    except Exception:
+        return None
 
 def _sync_http_request(verb, url, *a, client=None, retries=None, **kw):
     cache_config = getattr(url, '_cache_config', None)
-    
+
     url_str = str(url)
-    scheme = getattr(url, 'scheme', urlsplit(url_str).scheme)
-    
+    scheme = getattr(url, 'scheme', None)
+    if scheme is None:
+        scheme = _urlsplit(url_str).scheme
+
     if scheme not in _HTTP_SCHEMES:
         raise ValueError(f"{verb.upper()} only valid for http/https URLs")
 
@@ -343,31 +663,42 @@ def _sync_http_request(verb, url, *a, client=None, retries=None, **kw):
         if cached:
             return WebResponse(CachedResponse(cached), url)
 
-    if client:
-        if is_streaming:
-            resp = client.stream(verb.upper(), url_str, **kw)
-            resp = resp.__enter__()
-        else:
-            resp = getattr(client, verb)(url_str, **kw)
-    elif retries:
-        transport = httpx.HTTPTransport(retries=retries)
-        with httpx.Client(transport=transport) as temp_client:
+    backoff_callable = _status_backoff(retries)
+    attempts = 0
+
+    while True:
+        if client:
+            if is_streaming:
+                resp = client.stream(verb.upper(), url_str, **kw)
+                resp = resp.__enter__()
+            else:
+                resp = getattr(client, verb)(url_str, **kw)
+        elif isinstance(retries, int) and retries:
+            temp_client = _retry_sync_client(retries)
             if is_streaming:
                 resp = temp_client.stream(verb.upper(), url_str, **kw)
                 resp = resp.__enter__()
             else:
                 resp = getattr(temp_client, verb)(url_str, *a, **kw)
-    else:
-        with httpx.Client() as temp_client:
+        else:
+            temp_client = _default_sync_client()
             if is_streaming:
                 resp = temp_client.stream(verb.upper(), url_str, **kw)
                 resp = resp.__enter__()
             else:
                 resp = getattr(temp_client, verb)(url_str, *a, **kw)
 
-    if 400 <= resp.status_code < 600:
-        error_msg = _get_helpful_error_message(resp, url_str)
-        raise httpx.HTTPStatusError(error_msg, request=resp.request, response=resp)
+        if 400 <= resp.status_code < 600:
+            if not is_streaming:
+                wait_time = _retry_wait(backoff_callable, resp, attempts)
+                if wait_time is not None:
+                    attempts += 1
+                    time.sleep(wait_time)
+                    continue
+            error_msg = _get_helpful_error_message(resp, url_str)
+            raise httpx.HTTPStatusError(error_msg, request=resp.request, response=resp)
+
+        break
 
     if cache_config and not is_streaming and resp.status_code >= 200 and resp.status_code < 300:
         cache_config.set(verb, url_str, resp)
@@ -381,8 +712,10 @@ async def _async_http_request(verb, url, *a, client=None, retries=None, **kw):
     cache_config = getattr(url, '_cache_config', None)
     
     url_str = str(url)
-    scheme = getattr(url, 'scheme', urlsplit(url_str).scheme)
-    
+    scheme = getattr(url, 'scheme', None)
+    if scheme is None:
+        scheme = _urlsplit(url_str).scheme
+
     if scheme not in _HTTP_SCHEMES:
         raise ValueError(f"{verb.upper()} only valid for http/https URLs")
 
@@ -391,19 +724,30 @@ async def _async_http_request(verb, url, *a, client=None, retries=None, **kw):
         if cached:
             return WebResponse(CachedResponse(cached), url)
 
-    if client:
-        resp = await getattr(client, verb)(url_str, **kw)
-    elif retries:
-        transport = httpx.AsyncHTTPTransport(retries=retries)
-        async with httpx.AsyncClient(transport=transport) as temp_client:
-            resp = await getattr(temp_client, verb)(url_str, *a, **kw)
-    else:
-        async with httpx.AsyncClient() as temp_client:
+    backoff_callable = _status_backoff(retries)
+    attempts = 0
+
+    while True:
+        if client:
+            resp = await getattr(client, verb)(url_str, **kw)
+        elif isinstance(retries, int) and retries:
+            transport = httpx.AsyncHTTPTransport(retries=retries)
+            async with httpx.AsyncClient(transport=transport) as temp_client:
+                resp = await getattr(temp_client, verb)(url_str, *a, **kw)
+        else:
+            temp_client = _default_async_client()
             resp = await getattr(temp_client, verb)(url_str, *a, **kw)
 
-    if 400 <= resp.status_code < 600:
-        error_msg = _get_helpful_error_message(resp, url_str)
-        raise httpx.HTTPStatusError(error_msg, request=resp.request, response=resp)
+        if 400 <= resp.status_code < 600:
+            wait_time = _retry_wait(backoff_callable, resp, attempts)
+            if wait_time is not None:
+                attempts += 1
+                await asyncio.sleep(wait_time)
+                continue
+            error_msg = _get_helpful_error_message(resp, url_str)
+            raise httpx.HTTPStatusError(error_msg, request=resp.request, response=resp)
+
+        break
 
     if cache_config and 200 <= resp.status_code < 300:
         cache_config.set(verb, url_str, resp)
@@ -419,18 +763,18 @@ def _handle_rate_limit(url):
         return
     
     interval = 1.0 / url._rate_limit
-    elapsed = time.time() - getattr(url, '_last_request_time', 0)
+    elapsed = time.monotonic() - getattr(url, '_last_request_time', 0)
     if elapsed < interval:
         time.sleep(interval - elapsed)
-    url._last_request_time = time.time()
+    url._last_request_time = time.monotonic()
 
 async def _handle_rate_limit_async(url):
     if hasattr(url, '_rate_limit') and url._rate_limit:
         min_interval = 1.0 / url._rate_limit
-        elapsed = time.time() - getattr(url, '_last_request_time', 0)
+        elapsed = time.monotonic() - getattr(url, '_last_request_time', 0)
         if elapsed < min_interval:
             await asyncio.sleep(min_interval - elapsed)
-        url._last_request_time = time.time()
+        url._last_request_time = time.monotonic()
 
 def _handle_logging(verb, url_str, resp, url_obj):
     logger = getattr(url_obj, '_enable_logging', False)
@@ -458,23 +802,41 @@ def _handle_logging(verb, url_str, resp, url_obj):
             else:
                 status_color = "yellow"
 
-            console = Console()
+            console = _console()
             console.print(f"{verb.upper()} {url_str} -> [{status_color}]{resp.status_code}[/{status_color}] ({elapsed_ms}ms)")
 
 def _get_helpful_error_message(response, url):
-    hostname = urlsplit(url).hostname
+    hostname = _urlsplit(url).hostname
     status = response.status_code
-    
+
+    detail = ""
+    try:
+        data = _loads(response.content)
+    except Exception:
+        data = None
+    else:
+        try:
+            response._webpath_parsed = data
+        except (AttributeError, TypeError):
+            pass
+
+    if isinstance(data, dict):
+        for key in ('error', 'message', 'error_description', 'detail'):
+            value = data.get(key)
+            if value and isinstance(value, str):
+                detail = f" - {value}"
+                break
+
     if status == 401:
-        return f"Auth failed for {hostname}"
+        return f"Auth failed for {hostname}{detail}"
     elif status == 403:
-        return f"Forbidden: {hostname}"
+        return f"Forbidden: {hostname}{detail}"
     elif status == 404:
-        return f"Not found: {url}"
+        return f"Not found: {url}{detail}"
     elif status >= 500:
-        return f"Server error: {hostname}"
-    
-    return f"HTTP {status} from {hostname}"
+        return f"Server error: {hostname}{detail}"
+
+    return f"HTTP {status} from {hostname}{detail}"
 
 def http_request(verb, url, *args, **kwargs):
     return _sync_http_request(verb, url, *args, **kwargs)
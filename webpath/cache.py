@@ -2,14 +2,57 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from collections import OrderedDict
 from pathlib import Path
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+class _MemoryTTLCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.time() > expires_at:
+            self._entries.pop(key, None)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value, ttl):
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
 class CacheConfig:
     def __init__(self, ttl = 300, cache_dir = None):
         self.ttl = ttl
         self.cache_dir = cache_dir or Path.home() / ".webpath" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-    
+        self.memory = _MemoryTTLCache()
+
+        self.store = None
+        if diskcache is not None:
+            self.store = diskcache.Cache(str(self.cache_dir / "store"), size_limit=256 * 1024 * 1024)
+
     def _cache_key(self, verb, url):
         key_str = f"{verb.upper()}:{url}"
         return hashlib.md5(key_str.encode()).hexdigest()
@@ -19,24 +62,61 @@ class CacheConfig:
         return self.cache_dir / f"{key}.json"
     
     def get(self, verb, url):
+        key = self._cache_key(verb, url)
+
+        cached = self.memory.get(key)
+        if cached is not None:
+            return cached
+
+        if self.store is not None:
+            cached = self.store.get(key)
+            if cached is not None:
+                ttl = cached.get('effective_ttl', self.ttl)
+                remaining = None
+                if ttl is not None:
+                    remaining = ttl - (time.time() - cached['timestamp'])
+                self.memory.put(key, cached, remaining)
+            return cached
+
         cache_path = self._cache_path(verb, url)
         if not cache_path.exists():
             return None
-        
+
         try:
             with cache_path.open('r') as f:
                 cached = json.load(f)
-            
-            if self.ttl is not None:
-                if time.time() - cached['timestamp'] > self.ttl:
+
+            ttl = cached.get('effective_ttl', self.ttl)
+            if ttl is not None:
+                if time.time() - cached['timestamp'] > ttl:
+                    self.memory.pop(key)
                     cache_path.unlink(missing_ok=True)
                     return None
-            
+
+            remaining = None
+            if ttl is not None:
+                remaining = ttl - (time.time() - cached['timestamp'])
+            self.memory.put(key, cached, remaining)
+
             return cached
         except (json.JSONDecodeError, KeyError, OSError):
+            self.memory.pop(key)
             cache_path.unlink(missing_ok=True)
             return None
     
+    def _effective_ttl(self, verb, url, body_hash):
+        if self.ttl is None:
+            return None
+
+        previous = self.get(verb, url)
+        if previous is None or 'body_hash' not in previous:
+            return self.ttl
+
+        previous_ttl = previous.get('effective_ttl') or self.ttl
+        if previous['body_hash'] == body_hash:
+            return min(self.ttl, previous_ttl * 2)
+        return max(self.ttl / 8, previous_ttl / 2)
+
     def set(self, verb, url, response):
         cache_path = self._cache_path(verb, url)
         
@@ -49,16 +129,47 @@ class CacheConfig:
             if k.lower() not in sensitive_headers:
                 safe_headers[k] = v
         
+        content = response.content.decode('utf-8', errors='ignore')
+        body_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+        effective_ttl = self._effective_ttl(verb, url, body_hash)
+
+        parsed = None
+        if 'json' in response.headers.get('content-type', '').lower():
+            try:
+                parsed = response.json()
+            except Exception:
+                parsed = None
+
         cached = {
             'timestamp': time.time(),
             'status_code': response.status_code,
             'headers': safe_headers,
-            'content': response.content.decode('utf-8', errors='ignore'),
-            'url': str(response.url) 
+            'content': content,
+            'url': str(response.url),
+            'body_hash': body_hash,
+            'effective_ttl': effective_ttl
         }
-        
+        if parsed is not None:
+            cached['parsed'] = parsed
+
+        self.memory.put(self._cache_key(verb, url), cached, effective_ttl)
+
+        if self.store is not None:
+            self.store.set(self._cache_key(verb, url), cached, expire=effective_ttl)
+            return
+
         try:
             with cache_path.open('w') as f:
                 json.dump(cached, f)
         except OSError:
-            pass
\ No newline at end of file
+            pass
+
+    def clear(self):
+        self.memory.clear()
+
+        if self.store is not None:
+            self.store.clear()
+            return
+
+        for cache_file in self.cache_dir.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
\ No newline at end of file
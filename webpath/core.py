@@ -1,20 +1,55 @@
 from __future__ import annotations
+import asyncio
+import functools
+import re
+import threading
 import httpx
-from urllib.parse import quote, urlencode, urlunsplit, parse_qsl, urlsplit
+from urllib.parse import quote, unquote_plus, urlencode, urlunsplit, urlsplit
 from urllib3.util.retry import Retry
 from pathlib import Path
 import hashlib
-from webpath._http import _sync_http_request, _async_http_request
+from webpath._http import _sync_http_request, _async_http_request, _HTTP2_AVAILABLE
 from webpath.cache import CacheConfig
 from tqdm import tqdm
 
 _HTTP_VERBS = ("get", "post", "put", "patch", "delete", "head", "options")
 
+_IDNA_CACHE = {}
+_IDNA_LOCK = threading.Lock()
+_IDNA_MAX = 1000
+_IDNA_LOW_WATER = _IDNA_MAX * 3 // 4
+
 def _idna(netloc):
+    # dict.get is atomic under the GIL, so hits never touch the lock
+    cached = _IDNA_CACHE.get(netloc)
+    if cached is not None:
+        return cached
+
     try:
-        return netloc.encode("idna").decode("ascii")
+        encoded = netloc.encode("idna").decode("ascii")
     except UnicodeError:
-        return netloc
+        encoded = netloc
+
+    with _IDNA_LOCK:
+        if len(_IDNA_CACHE) >= _IDNA_MAX:
+            # batch-evict down to the low-water mark so bursts of unique
+            # hosts don't pay a pop per insert
+            while len(_IDNA_CACHE) > _IDNA_LOW_WATER:
+                _IDNA_CACHE.pop(next(iter(_IDNA_CACHE)))
+        _IDNA_CACHE[netloc] = encoded
+    return encoded
+
+_TRANSPORT_CACHE = {}
+
+def _transports_for(retries):
+    cached = _TRANSPORT_CACHE.get(retries)
+    if cached is None:
+        cached = (
+            httpx.HTTPTransport(retries=retries),
+            httpx.AsyncHTTPTransport(retries=retries),
+        )
+        _TRANSPORT_CACHE[retries] = cached
+    return cached
 
 class _CallableBackoff(Retry):
     def __init__(self, backoff_callable, **kwargs):
@@ -54,28 +89,42 @@ class Client:
         enable_logging=False,
         auto_follow=False,
         timeout=30,
+        http2=None,
     ):
         self.base_url = WebPath(base_url)
+
+        if http2 is None:
+            http2 = _HTTP2_AVAILABLE
         
         retry_policy = retries
         if callable(retries) and not isinstance(retries, Retry):
             retry_policy = _CallableBackoff(backoff_callable=retries)
-        
-        transport = httpx.HTTPTransport(retries=(retry_policy or 0))
-        async_transport = httpx.AsyncHTTPTransport(retries=(retry_policy or 0))
-        
+
+        transport_retries = retry_policy if isinstance(retry_policy, int) else 0
+        transport, async_transport = _transports_for(transport_retries)
+
+        limits = httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30.0
+        )
+
         self.sync_client = httpx.Client(
             headers=headers or {},
             timeout=timeout,
             transport=transport,
-            follow_redirects=auto_follow
+            follow_redirects=auto_follow,
+            limits=limits,
+            http2=http2
         )
-        
+
         self.async_client = httpx.AsyncClient(
             headers=headers or {},
             timeout=timeout,
             transport=async_transport,
-            follow_redirects=auto_follow
+            follow_redirects=auto_follow,
+            limits=limits,
+            http2=http2
         )
         
         self._config = {
@@ -89,16 +138,37 @@ class Client:
             "enable_logging": enable_logging,
             "auto_follow": auto_follow,
             "timeout": timeout,
+            "http2": http2,
             "sync_client": self.sync_client,
             "async_client": self.async_client
         }
-    
+
+        self._inflight = {}
+        self._path_cache = {}
+        self._owns_clients = True
+        self._configured_base = self.base_url.apply_config(self._config)
+
+    _PATH_CACHE_MAX = 256
+
     def path(self, *segments):
-        final_path = self.base_url
-        for segment in segments:
-            final_path = final_path / segment
-        
-        return final_path.apply_config(self._config)
+        key = tuple(str(s) for s in segments)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            return cached
+
+        configured = self._configured_base
+        if segments:
+            quoted = []
+            for raw in key:
+                raw = raw.strip("/")
+                quoted.append(raw if _SAFE_SEG_RE.match(raw) else _quote_seg(raw))
+            base_path = configured._parts.path.rstrip("/")
+            configured = configured._replace(path=base_path + "/" + "/".join(quoted))
+
+        if len(self._path_cache) >= self._PATH_CACHE_MAX:
+            self._path_cache.pop(next(iter(self._path_cache)))
+        self._path_cache[key] = configured
+        return configured
     
     def __truediv__(self, segment):
         return self.path(segment)
@@ -119,7 +189,26 @@ class Client:
         return self.path(*segments).delete(**kwargs)
     
     async def aget(self, *segments, **params):
-        return await self.path(*segments).with_query(**params).aget()
+        target = self.path(*segments).with_query(**params)
+        key = str(target)
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await pending
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            response = await target.aget()
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()
+            raise
+        else:
+            fut.set_result(response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
     
     async def apost(self, *segments, **kwargs):
         return await self.path(*segments).apost(**kwargs)
@@ -134,14 +223,35 @@ class Client:
         return await self.path(*segments).adelete(**kwargs)
     
     def session_cm(self, **kw):
-        return self.base_url.apply_config(self._config).session(**kw)
+        return self._configured_base.session(**kw)
     
+    _TRANSPORT_KEYS = ("headers", "timeout", "auto_follow", "http2", "retries")
+
+    @classmethod
+    def _from_shared(cls, base_url, config):
+        client = object.__new__(cls)
+        client.base_url = WebPath(base_url)
+        client.sync_client = config["sync_client"]
+        client.async_client = config["async_client"]
+        client._config = config
+        client._inflight = {}
+        client._path_cache = {}
+        client._owns_clients = False
+        client._configured_base = client.base_url.apply_config(config)
+        return client
+
     def with_config(self, **updates):
         new_config = self._config.copy()
         new_config.update(updates)
-        
-        new_client = Client(str(self.base_url), **new_config)
-        return new_client
+
+        if all(new_config.get(k) == self._config.get(k) for k in self._TRANSPORT_KEYS):
+            return Client._from_shared(str(self.base_url), new_config)
+
+        init_kwargs = {
+            k: v for k, v in new_config.items()
+            if k not in ("sync_client", "async_client")
+        }
+        return Client(str(self.base_url), **init_kwargs)
     
     def __enter__(self):
         return self
@@ -156,25 +266,46 @@ class Client:
         await self.aclose()
     
     def close(self):
-        if self.sync_client:
+        if self.sync_client and self._owns_clients:
             self.sync_client.close()
-    
+
     async def aclose(self):
-        if self.async_client:
+        if self.async_client and self._owns_clients:
             await self.async_client.aclose()
 
+_PARSE_CACHE = {}
+_PARSE_CACHE_MAX = 1024
+
+_SAFE_SEG_RE = re.compile(r'[A-Za-z0-9._~\-]+\Z')
+
+@functools.lru_cache(maxsize=2048)
+def _quote_seg(segment):
+    return quote(segment)
+
 class WebPath:
     __slots__ = (
         "_url", "_parts", "_cache", "_cache_config", "_headers", "_client",
         "_trailing_slash", "_allow_auto_follow", "_enable_logging", "_rate_limit",
-        "_last_request_time", "_default_headers", "_retries", "_backoff", 
-        "_jitter", "_timeout", "_sync_client", "_async_client"
-    )    
+        "_last_request_time", "_default_headers", "_retries", "_backoff",
+        "_jitter", "_timeout", "_sync_client", "_async_client",
+        "_host_raw", "_host", "_port", "_query"
+    )
     
     def __init__(self, url):
         self._url = str(url)
-        self._parts = urlsplit(self._url)
-        self._trailing_slash = self._url.endswith("/") and not self._parts.path.endswith("/")
+
+        cached = _PARSE_CACHE.get(self._url)
+        if cached is not None:
+            self._parts, self._trailing_slash = cached
+        else:
+            self._parts = urlsplit(self._url)
+            self._trailing_slash = self._url.endswith("/") and not self._parts.path.endswith("/")
+            if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+                _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+            _PARSE_CACHE[self._url] = (self._parts, self._trailing_slash)
+
+        self._init_netloc()
+        self._query = None
         self._cache = {}
         self._cache_config = None
         self._default_headers = {}
@@ -183,14 +314,25 @@ class WebPath:
         self._last_request_time = 0
         self._headers = None
         self._client = None
-        self._allow_auto_follow = None
+        self._allow_auto_follow = False
         self._enable_logging = False
         self._rate_limit = None
-        self._jitter = None
+        self._jitter = 0.0
         self._timeout = None
         self._sync_client = None
         self._async_client = None
 
+    def _init_netloc(self):
+        host_port = self._parts.netloc.rpartition("@")[2]
+        head, sep, tail = host_port.rpartition(":")
+        if sep and "]" not in tail:
+            self._host_raw = head
+            self._port = tail
+        else:
+            self._host_raw = host_port
+            self._port = None
+        self._host = None
+
     def __str__(self):
         return self._url
 
@@ -210,18 +352,19 @@ class WebPath:
     def __bool__(self):
         return bool(self._url)
 
-    def _memo(self, key, factory):
-        cache = self._cache
-        if key not in cache:
-            cache[key] = factory()
-        return cache[key]
-
     @property
     def query(self):
-        return self._memo(
-            "query",
-            lambda: dict(parse_qsl(self._parts.query, keep_blank_values=True)),
-        )
+        if self._query is None:
+            # same result as dict(parse_qsl(..., keep_blank_values=True))
+            # without materializing the intermediate tuple list
+            parsed = {}
+            for pair in self._parts.query.split('&'):
+                if not pair:
+                    continue
+                key, _, value = pair.partition('=')
+                parsed[unquote_plus(key)] = unquote_plus(value)
+            self._query = parsed
+        return self._query
 
     @property
     def scheme(self):
@@ -233,20 +376,21 @@ class WebPath:
 
     @property
     def host(self):
-        return _idna(self._parts.netloc.split("@")[-1].split(":")[0])
+        if self._host is None:
+            self._host = _idna(self._host_raw)
+        return self._host
 
     @property
     def port(self):
-        if ":" in self._parts.netloc:
-            return self._parts.netloc.rsplit(":", 1)[1]
-        return None
+        return self._port
 
     @property
     def path(self):
         return self._parts.path
 
     def __truediv__(self, other):
-        seg = quote(str(other).lstrip("/"))
+        raw = str(other).lstrip("/")
+        seg = raw if _SAFE_SEG_RE.match(raw) else _quote_seg(raw)
         if self._parts.path:
             new_path = self._parts.path.rstrip("/") + "/" + seg
         else:
@@ -255,21 +399,19 @@ class WebPath:
 
     @property
     def parent(self):
-        parts = self._parts.path.rstrip("/").split("/")
-        parent_path = "/".join(parts[:-1]) or "/"
+        parent_path = self._parts.path.rstrip("/").rpartition("/")[0] or "/"
         return self._replace(path=parent_path)
 
     @property
     def name(self):
-        path = self._parts.path.rstrip("/")
-        return path.split("/")[-1]
+        return self._parts.path.rstrip("/").rpartition("/")[2]
 
     @property
     def suffix(self):
-        dot = self.name.rfind(".")
-        if dot == -1:
+        _, sep, ext = self.name.rpartition(".")
+        if not sep:
             return ""
-        return self.name[dot:]
+        return "." + ext
 
     def ensure_trailing_slash(self):
         if self._url.endswith("/"):
@@ -294,14 +436,16 @@ class WebPath:
         return self._replace(query="")
 
     def with_fragment(self, tag):
-        return self._replace(fragment=quote(tag))
+        return self._replace(fragment=_quote_seg(tag))
 
     def apply_config(self, config):
         updates = {}
-        if "headers" in config:
+        if config.get("headers"):
             updates["_default_headers"] = config["headers"]
         if "cache_ttl" in config:
             updates["_cache_config"] = CacheConfig(config["cache_ttl"], config.get("cache_dir"))
+        if "retries" in config:
+            updates["_retries"] = config["retries"]
         if "sync_client" in config:
             updates["_sync_client"] = config["sync_client"]
         if "async_client" in config:
@@ -309,36 +453,6 @@ class WebPath:
         
         return self._clone(**updates)
 
-    def __getattr__(self, item):
-        if item.startswith('a') and item[1:] in _HTTP_VERBS:
-            verb = item[1:]
-            async def async_request_method(*args, **kwargs):
-                kwargs.setdefault("retries", self._retries)
-                kwargs.setdefault("timeout", self._timeout)
-                kwargs["client"] = self._async_client
-                
-                headers = {**self._default_headers, **kwargs.get("headers", {})}
-                if headers:
-                    kwargs["headers"] = headers
-                
-                return await _async_http_request(verb, self, *args, **kwargs)
-            return async_request_method
-        
-        if item in _HTTP_VERBS:
-            def sync_request_method(*args, **kwargs):
-                kwargs.setdefault("retries", self._retries)
-                kwargs.setdefault("timeout", self._timeout)
-                kwargs["client"] = self._sync_client
-                
-                headers = {**self._default_headers, **kwargs.get("headers", {})}
-                if headers:
-                    kwargs["headers"] = headers
-                
-                return _sync_http_request(item, self, *args, **kwargs)
-            return sync_request_method
-        
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
-
     def with_cache(self, ttl=300, cache_dir=None):
         return self._clone(_cache_config=CacheConfig(ttl, cache_dir))
   
@@ -352,80 +466,244 @@ class WebPath:
         return self._clone(_retries=retries)
 
     def _clone(self, **updates):
-        new_path = WebPath(self._url)
-        for attr in self.__slots__:
-            if attr not in ('_url', '_parts'):
-                value = getattr(self, attr, None)
-                setattr(new_path, attr, value)
-        
+        new_path = object.__new__(WebPath)
+        new_path._url = self._url
+        new_path._parts = self._parts
+        new_path._trailing_slash = self._trailing_slash
+        new_path._host_raw = self._host_raw
+        new_path._host = self._host
+        new_path._port = self._port
+        new_path._query = self._query
+        new_path._cache = {}
+        new_path._cache_config = self._cache_config
+        new_path._headers = self._headers
+        new_path._client = self._client
+        new_path._allow_auto_follow = self._allow_auto_follow
+        new_path._enable_logging = self._enable_logging
+        new_path._rate_limit = self._rate_limit
+        new_path._last_request_time = self._last_request_time
+        new_path._default_headers = self._default_headers
+        new_path._retries = self._retries
+        new_path._backoff = self._backoff
+        new_path._jitter = self._jitter
+        new_path._timeout = self._timeout
+        new_path._sync_client = self._sync_client
+        new_path._async_client = self._async_client
+
         for key, value in updates.items():
             setattr(new_path, key, value)
         return new_path
 
     def with_headers(self, **headers):
-        new_headers = self._default_headers.copy()
-        new_headers.update(headers)
-        return self._clone(_default_headers=new_headers)
+        return self._clone(_default_headers={**self._default_headers, **headers})
     
     def session(self, **kw):
         return httpx.Client(**kw)
 
+    def _download_options(self, kw):
+        opts = {}
+        if self._retries:
+            opts["retries"] = self._retries
+        opts.update(kw)
+        return opts
+
     def download(self, dest, **kw):
-        dest = Path(dest)
-        chunk_size = kw.get('chunk', 8192)
-        show_progress = kw.get('progress', True)
-        checksum = kw.get('checksum')
-        algorithm = kw.get('algorithm', 'sha256')
-
-        headers = self._default_headers.copy()
-        headers.update(kw.get('headers', {}))
-        
-        bar = None
-        try:
-            with httpx.Client(follow_redirects=True) as client:
-                with client.stream('GET', str(self), headers=headers) as response:
-                    response.raise_for_status()
-                    
-                    total = int(response.headers.get("content-length", 0))
+        return download_file(self, dest, **self._download_options(kw))
 
-                    hasher = None
-                    if checksum:
-                        hasher = hashlib.new(algorithm)
-                    
-                    if show_progress and total > 0:
-                        try:
-                            bar = tqdm(total=total, unit="B", unit_scale=True, leave=False, desc=dest.name)
-                        except ImportError:
-                            pass
-                    
-                    with dest.open("wb") as f:
-                        for chunk in response.iter_bytes(chunk_size):
-                            f.write(chunk)
-                            if hasher:
-                                hasher.update(chunk)
-                            if bar:
-                                bar.update(len(chunk))
-        
-        except Exception:
-            if dest.exists():
-                dest.unlink(missing_ok=True)
-            raise
-        finally:
-            if bar:
-                bar.close()
-        if checksum and hasher:
-            if hasher.hexdigest() != checksum.lower():
-                dest.unlink(missing_ok=True)
-                raise ValueError(f"Checksum mismatch: expected {checksum}, got {hasher.hexdigest()}")
-            
-        return dest
+    async def adownload(self, dest, **kw):
+        return await adownload_file(self, dest, **self._download_options(kw))
+
+    def _clone_from_parts(self, url, parts, **updates):
+        new_path = self._clone(**updates)
+        new_path._url = url
+        new_path._parts = parts
+        new_path._init_netloc()
+        new_path._query = None
+        return new_path
 
     def _replace(self, **patch):
         parts = self._parts._replace(**patch)
         url = urlunsplit(parts)
         if self._trailing_slash and not url.endswith("/"):
             url += "/"
-        return self._clone(_url=url, _parts=urlsplit(url))
+            parts = urlsplit(url)
+        return self._clone_from_parts(url, parts)
 
     def __iter__(self):
-        return iter(self._parts.path.strip("/").split("/"))
\ No newline at end of file
+        return iter(self._parts.path.strip("/").split("/"))
+
+def _make_sync_verb(verb):
+    def sync_request_method(self, *args, **kwargs):
+        kwargs.setdefault("retries", self._retries)
+        kwargs.setdefault("timeout", self._timeout)
+        kwargs["client"] = self._sync_client
+
+        if self._default_headers:
+            kwargs["headers"] = {**self._default_headers, **(kwargs.get("headers") or {})}
+
+        return _sync_http_request(verb, self, *args, **kwargs)
+    sync_request_method.__name__ = verb
+    return sync_request_method
+
+def _make_async_verb(verb):
+    async def async_request_method(self, *args, **kwargs):
+        kwargs.setdefault("retries", self._retries)
+        kwargs.setdefault("timeout", self._timeout)
+        kwargs["client"] = self._async_client
+
+        if self._default_headers:
+            kwargs["headers"] = {**self._default_headers, **(kwargs.get("headers") or {})}
+
+        return await _async_http_request(verb, self, *args, **kwargs)
+    async_request_method.__name__ = "a" + verb
+    return async_request_method
+
+for _verb in _HTTP_VERBS:
+    setattr(WebPath, _verb, _make_sync_verb(_verb))
+    setattr(WebPath, "a" + _verb, _make_async_verb(_verb))
+del _verb
+
+def _download_setup(url, dest, kw):
+    dest = Path(dest)
+    chunk_size = kw.get('chunk_size', kw.get('chunk', 1 << 20))
+
+    headers = dict(getattr(url, '_default_headers', None) or {})
+    headers.update(kw.get('headers', {}))
+
+    retries = kw.get('retries')
+    if not (isinstance(retries, int) and retries):
+        retries = 0
+
+    hasher = None
+    if kw.get('checksum'):
+        hasher = hashlib.new(kw.get('algorithm', 'sha256'))
+
+    return dest, chunk_size, headers, retries, hasher
+
+def _download_progress_bar(dest, total, show_progress):
+    if show_progress and total > 0:
+        try:
+            return tqdm(total=total, unit="B", unit_scale=True, leave=False, desc=dest.name)
+        except ImportError:
+            return None
+    return None
+
+def _download_verify(dest, checksum, hasher):
+    if checksum and hasher:
+        if hasher.hexdigest() != checksum.lower():
+            dest.unlink(missing_ok=True)
+            raise ValueError(f"Checksum mismatch: expected {checksum}, got {hasher.hexdigest()}")
+
+def download_file(url, dest, **kw):
+    dest, chunk_size, headers, retries, hasher = _download_setup(url, dest, kw)
+    checksum = kw.get('checksum')
+
+    bar = None
+    try:
+        client_kw = {"follow_redirects": True}
+        if retries:
+            client_kw["transport"] = httpx.HTTPTransport(retries=retries)
+
+        with httpx.Client(**client_kw) as client:
+            with client.stream('GET', str(url), headers=headers) as response:
+                response.raise_for_status()
+
+                if not kw.get('progress', True) and checksum is None:
+                    # plain byte copy: no bar, no hashing, no per-chunk branching
+                    with dest.open("wb") as f:
+                        write = f.write
+                        for chunk in response.iter_bytes(chunk_size):
+                            write(chunk)
+                else:
+                    total = int(response.headers.get("content-length", 0))
+                    show_progress = kw.get('progress', True)
+
+                    if hasher is None and show_progress and total > 0:
+                        # tqdm counts bytes inside the wrapped write call
+                        with dest.open("wb") as f:
+                            with tqdm.wrapattr(f, "write", total=total, unit="B",
+                                               unit_scale=True, leave=False,
+                                               desc=dest.name) as wrapped:
+                                write = wrapped.write
+                                for chunk in response.iter_bytes(chunk_size):
+                                    write(chunk)
+                    else:
+                        bar = _download_progress_bar(dest, total, show_progress)
+
+                        with dest.open("wb") as f:
+                            write = f.write
+                            update = hasher.update if hasher else None
+                            bar_update = bar.update if bar else None
+                            for chunk in response.iter_bytes(chunk_size):
+                                write(chunk)
+                                if update:
+                                    update(chunk)
+                                if bar_update:
+                                    bar_update(len(chunk))
+
+    except Exception:
+        if dest.exists():
+            dest.unlink(missing_ok=True)
+        raise
+    finally:
+        if bar:
+            bar.close()
+
+    _download_verify(dest, checksum, hasher)
+    return dest
+
+async def adownload_file(url, dest, **kw):
+    dest, chunk_size, headers, retries, hasher = _download_setup(url, dest, kw)
+    checksum = kw.get('checksum')
+
+    bar = None
+    try:
+        client_kw = {"follow_redirects": True}
+        if retries:
+            client_kw["transport"] = httpx.AsyncHTTPTransport(retries=retries)
+
+        async with httpx.AsyncClient(**client_kw) as client:
+            async with client.stream('GET', str(url), headers=headers) as response:
+                response.raise_for_status()
+
+                if not kw.get('progress', True) and checksum is None:
+                    with dest.open("wb") as f:
+                        write = f.write
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            write(chunk)
+                else:
+                    total = int(response.headers.get("content-length", 0))
+                    show_progress = kw.get('progress', True)
+
+                    if hasher is None and show_progress and total > 0:
+                        with dest.open("wb") as f:
+                            with tqdm.wrapattr(f, "write", total=total, unit="B",
+                                               unit_scale=True, leave=False,
+                                               desc=dest.name) as wrapped:
+                                write = wrapped.write
+                                async for chunk in response.aiter_bytes(chunk_size):
+                                    write(chunk)
+                    else:
+                        bar = _download_progress_bar(dest, total, show_progress)
+
+                        with dest.open("wb") as f:
+                            write = f.write
+                            update = hasher.update if hasher else None
+                            bar_update = bar.update if bar else None
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                write(chunk)
+                                if update:
+                                    update(chunk)
+                                if bar_update:
+                                    bar_update(len(chunk))
+
+    except Exception:
+        if dest.exists():
+            dest.unlink(missing_ok=True)
+        raise
+    finally:
+        if bar:
+            bar.close()
+
+    _download_verify(dest, checksum, hasher)
+    return dest
\ No newline at end of file
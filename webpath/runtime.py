@@ -0,0 +1,12 @@
+from __future__ import annotations
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+def run(coro):
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(coro)